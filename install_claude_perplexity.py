@@ -133,25 +133,35 @@ class InstallationStage:
             context['state'].mark_failed(self.name, str(e))
             raise
 
+# Message templates resolved once at module load (colors are constants,
+# so there is no need to rebuild the f-strings on every call)
+_HEADER_RULE = f"{Colors.HEADER}{Colors.BOLD}{'=' * 70}{Colors.ENDC}"
+_MSG_TEMPLATES = {
+    'header': f"{Colors.HEADER}{Colors.BOLD}%s{Colors.ENDC}",
+    'stage': f"{Colors.OKBLUE}[STAGE] %s{Colors.ENDC}",
+    'success': f"{Colors.OKGREEN}[✓] %s{Colors.ENDC}",
+    'info': f"{Colors.OKCYAN}[→] %s{Colors.ENDC}",
+    'warning': f"{Colors.WARNING}[⚠] %s{Colors.ENDC}",
+    'error': f"{Colors.FAIL}[✗] %s{Colors.ENDC}",
+}
+
 def print_header(text):
-    print(f"\n{Colors.HEADER}{Colors.BOLD}{'=' * 70}{Colors.ENDC}")
-    print(f"{Colors.HEADER}{Colors.BOLD}{text.center(70)}{Colors.ENDC}")
-    print(f"{Colors.HEADER}{Colors.BOLD}{'=' * 70}{Colors.ENDC}\n")
+    print(f"\n{_HEADER_RULE}\n{_MSG_TEMPLATES['header'] % text.center(70)}\n{_HEADER_RULE}\n")
 
 def print_stage(text):
-    print(f"{Colors.OKBLUE}[STAGE] {text}{Colors.ENDC}")
+    print(_MSG_TEMPLATES['stage'] % text)
 
 def print_success(text):
-    print(f"{Colors.OKGREEN}[✓] {text}{Colors.ENDC}")
+    print(_MSG_TEMPLATES['success'] % text)
 
 def print_info(text):
-    print(f"{Colors.OKCYAN}[→] {text}{Colors.ENDC}")
+    print(_MSG_TEMPLATES['info'] % text)
 
 def print_warning(text):
-    print(f"{Colors.WARNING}[⚠] {text}{Colors.ENDC}")
+    print(_MSG_TEMPLATES['warning'] % text)
 
 def print_error(text):
-    print(f"{Colors.FAIL}[✗] {text}{Colors.ENDC}")
+    print(_MSG_TEMPLATES['error'] % text)
 
 def run_command(cmd, check=True, capture_output=False, cwd=None, shell=True):
     """Run a command"""
@@ -733,27 +743,33 @@ def main():
             # Execute stage
             stage.execute(context)
 
-        # Installation complete
+        # Installation complete - batch the summary into one write
         print()
         print_header("Installation Complete!")
-        print()
-        print_success("All stages completed successfully!")
-        print()
-        print_info("Installation directory:")
-        print(f"  {context['install_dir']}")
-        print()
-        print_info("Wrapper directory:")
-        print(f"  {context['wrapper_dir']}")
-        print()
-        print_info("Next steps:")
-        print(f"  1. Review: {context['install_dir'] / 'INSTALLATION_INFO.txt'}")
-        print(f"  2. Launch: python launch_claude_perplexity.py")
-        print()
+        summary = [
+            "",
+            _MSG_TEMPLATES['success'] % "All stages completed successfully!",
+            "",
+            _MSG_TEMPLATES['info'] % "Installation directory:",
+            f"  {context['install_dir']}",
+            "",
+            _MSG_TEMPLATES['info'] % "Wrapper directory:",
+            f"  {context['wrapper_dir']}",
+            "",
+            _MSG_TEMPLATES['info'] % "Next steps:",
+            f"  1. Review: {context['install_dir'] / 'INSTALLATION_INFO.txt'}",
+            "  2. Launch: python launch_claude_perplexity.py",
+            "",
+        ]
 
         if context.get('session_token') == "CONFIGURE_ME":
-            print_warning("Remember to configure your session token in:")
-            print(f"  {context['wrapper_dir'] / '.env'}")
-            print()
+            summary.extend([
+                _MSG_TEMPLATES['warning'] % "Remember to configure your session token in:",
+                f"  {context['wrapper_dir'] / '.env'}",
+                "",
+            ])
+
+        sys.stdout.write("\n".join(summary) + "\n")
 
         # Clean up state file
         state_file.unlink()
@@ -29,14 +29,22 @@ if sys.platform == 'win32':
         # If wrapping fails, continue without it
         pass
 
+# Disable colors when stdout is piped (log files) or NO_COLOR is set
+_USE_COLOR = sys.stdout.isatty() and os.environ.get("NO_COLOR") is None
+
 class Colors:
-    """ANSI color codes"""
-    OKGREEN = '\033[92m'
-    WARNING = '\033[93m'
-    FAIL = '\033[91m'
-    OKCYAN = '\033[96m'
-    ENDC = '\033[0m'
-    BOLD = '\033[1m'
+    """ANSI color codes (blank when stdout is not a TTY or NO_COLOR is set)"""
+    OKGREEN = '\033[92m' if _USE_COLOR else ''
+    WARNING = '\033[93m' if _USE_COLOR else ''
+    FAIL = '\033[91m' if _USE_COLOR else ''
+    OKCYAN = '\033[96m' if _USE_COLOR else ''
+    ENDC = '\033[0m' if _USE_COLOR else ''
+    BOLD = '\033[1m' if _USE_COLOR else ''
+
+    @staticmethod
+    def c(text, code):
+        """Wrap text in a color code, skipping the formatting entirely when colors are off"""
+        return f"{code}{text}{Colors.ENDC}" if _USE_COLOR else text
 
 class LogManager:
     """Manage timestamped log files for services"""
@@ -62,7 +70,7 @@ class LogManager:
             self.log_files[key] = (log_file, file_handle)
 
             # Print to console
-            print(f"{Colors.OKCYAN}→ {service_name} {stream_type}: {log_file}{Colors.ENDC}")
+            print(Colors.c(f"→ {service_name} {stream_type}: {log_file}", Colors.OKCYAN))
 
         return self.log_files[key]
 
@@ -72,14 +80,14 @@ class LogManager:
         services: list of service names (e.g., ["Perplexity", "LiteLLM"])
         """
         if os.name != 'nt':
-            print(f"{Colors.WARNING}⚠ Tail windows only supported on Windows{Colors.ENDC}")
+            print(Colors.c("⚠ Tail windows only supported on Windows", Colors.WARNING))
             return
 
         if services is None:
             services = ["Perplexity", "LiteLLM"]
 
         print()
-        print(f"{Colors.OKCYAN}Opening tail windows...{Colors.ENDC}")
+        print(Colors.c("Opening tail windows...", Colors.OKCYAN))
 
         for service in services:
             # Find the combined log file (stdout + stderr will be shown)
@@ -92,7 +100,7 @@ class LogManager:
             if log_file and log_file.exists():
                 self._open_tail_window(service, log_file)
             else:
-                print(f"{Colors.WARNING}  ⚠ No log file found for {service}{Colors.ENDC}")
+                print(Colors.c(f"  ⚠ No log file found for {service}", Colors.WARNING))
 
     def _open_tail_window(self, service_name: str, log_file: Path):
         """Open a PowerShell window to tail a log file"""
@@ -119,9 +127,9 @@ class LogManager:
             )
 
             self.tail_processes.append(process)
-            print(f"{Colors.OKGREEN}✓ Opened tail window for {service_name}{Colors.ENDC}")
+            print(Colors.c(f"✓ Opened tail window for {service_name}", Colors.OKGREEN))
         except Exception as e:
-            print(f"{Colors.WARNING}⚠ Could not open tail window for {service_name}: {e}{Colors.ENDC}")
+            print(Colors.c(f"⚠ Could not open tail window for {service_name}: {e}", Colors.WARNING))
 
     def close_all(self):
         """Close all open log files and tail windows"""
@@ -138,20 +146,20 @@ class LogManager:
             except:
                 pass
 
+# Horizontal rule for banners, built once
+_RULE = "=" * 60
+
+# Status -> (symbol, color) dispatch table, resolved once at module load
+_STATUS_MAP = {
+    "running": ("✓", Colors.OKGREEN),
+    "starting": ("→", Colors.OKCYAN),
+    "stopped": ("■", Colors.WARNING),
+    "error": ("✗", Colors.FAIL),
+}
+
 def print_status(service, status, message=""):
     """Print service status"""
-    if status == "running":
-        symbol = "✓"
-        color = Colors.OKGREEN
-    elif status == "starting":
-        symbol = "→"
-        color = Colors.OKCYAN
-    elif status == "stopped":
-        symbol = "■"
-        color = Colors.WARNING
-    else:
-        symbol = "✗"
-        color = Colors.FAIL
+    symbol, color = _STATUS_MAP.get(status, _STATUS_MAP["error"])
 
     msg = f"{color}{symbol} {service}{Colors.ENDC}"
     if message:
@@ -210,18 +218,18 @@ class ServiceMonitor:
                     if not check_service_health("http://localhost:8000/health"):
                         if not self.wrapper_down:
                             print()
-                            print(f"{Colors.WARNING}⚠ Perplexity Wrapper is not responding{Colors.ENDC}")
+                            print(Colors.c("⚠ Perplexity Wrapper is not responding", Colors.WARNING))
                             self.wrapper_down = True
                     else:
                         if self.wrapper_down:
                             print()
-                            print(f"{Colors.OKGREEN}✓ Perplexity Wrapper recovered{Colors.ENDC}")
+                            print(Colors.c("✓ Perplexity Wrapper recovered", Colors.OKGREEN))
                             self.wrapper_down = False
                 else:
                     # Process died
                     if self.wrapper_process and not self.wrapper_down:
                         print()
-                        print(f"{Colors.FAIL}✗ Perplexity Wrapper process died (code: {self.wrapper_process.poll()}){Colors.ENDC}")
+                        print(Colors.c(f"✗ Perplexity Wrapper process died (code: {self.wrapper_process.poll()})", Colors.FAIL))
                         self.wrapper_down = True
 
                 # Check LiteLLM Proxy
@@ -230,18 +238,18 @@ class ServiceMonitor:
                     if not check_service_health("http://localhost:8080/health/readiness"):
                         if not self.litellm_down:
                             print()
-                            print(f"{Colors.WARNING}⚠ LiteLLM Proxy is not responding{Colors.ENDC}")
+                            print(Colors.c("⚠ LiteLLM Proxy is not responding", Colors.WARNING))
                             self.litellm_down = True
                     else:
                         if self.litellm_down:
                             print()
-                            print(f"{Colors.OKGREEN}✓ LiteLLM Proxy recovered{Colors.ENDC}")
+                            print(Colors.c("✓ LiteLLM Proxy recovered", Colors.OKGREEN))
                             self.litellm_down = False
                 else:
                     # Process died
                     if self.litellm_process and not self.litellm_down:
                         print()
-                        print(f"{Colors.FAIL}✗ LiteLLM Proxy process died (code: {self.litellm_process.poll()}){Colors.ENDC}")
+                        print(Colors.c(f"✗ LiteLLM Proxy process died (code: {self.litellm_process.poll()})", Colors.FAIL))
                         self.litellm_down = True
 
                 time.sleep(self.check_interval)
@@ -260,7 +268,7 @@ def fetch_available_models(base_url: str = "http://localhost:8000") -> list:
             models = [m["id"] for m in data.get("data", [])]
             return sorted(models)
     except Exception as e:
-        print(f"{Colors.WARNING}Warning: Could not fetch models: {e}{Colors.ENDC}")
+        print(Colors.c(f"Warning: Could not fetch models: {e}", Colors.WARNING))
         return []
 
 def read_litellm_models(install_dir: Path) -> list:
@@ -280,7 +288,7 @@ def read_litellm_models(install_dir: Path) -> list:
     except ImportError:
         return []
     except Exception as e:
-        print(f"{Colors.WARNING}Warning: Could not read models: {e}{Colors.ENDC}")
+        print(Colors.c(f"Warning: Could not read models: {e}", Colors.WARNING))
         return []
 
 def update_litellm_config(install_dir: Path, models: list) -> None:
@@ -290,7 +298,7 @@ def update_litellm_config(install_dir: Path, models: list) -> None:
     config_file = install_dir / "litellm_config.yaml"
 
     if not config_file.exists():
-        print(f"{Colors.WARNING}Warning: Config file not found{Colors.ENDC}")
+        print(Colors.c("Warning: Config file not found", Colors.WARNING))
         return
 
     try:
@@ -322,21 +330,21 @@ def update_litellm_config(install_dir: Path, models: list) -> None:
         with open(config_file, 'w') as f:
             yaml.dump(config, f, default_flow_style=False, sort_keys=False)
 
-        print(f"{Colors.OKGREEN}✓ Updated litellm config with {len(models)} model(s){Colors.ENDC}")
+        print(Colors.c(f"✓ Updated litellm config with {len(models)} model(s)", Colors.OKGREEN))
         for model in models[:5]:
             print(f"  - {model}")
         if len(models) > 5:
             print(f"  ... and {len(models) - 5} more")
     except ImportError:
-        print(f"{Colors.WARNING}Warning: PyYAML not installed, cannot update config{Colors.ENDC}")
+        print(Colors.c("Warning: PyYAML not installed, cannot update config", Colors.WARNING))
     except Exception as e:
-        print(f"{Colors.WARNING}Warning: Could not update config: {e}{Colors.ENDC}")
+        print(Colors.c(f"Warning: Could not update config: {e}", Colors.WARNING))
 
 def get_install_dir() -> Path:
     """Get installation directory"""
     install_dir = Path.home() / ".claude-perplexity"
     if not install_dir.exists():
-        print(f"{Colors.FAIL}Error: Installation directory not found{Colors.ENDC}")
+        print(Colors.c("Error: Installation directory not found", Colors.FAIL))
         print(f"Expected: {install_dir}")
         print("Run install_claude_perplexity.py first")
         sys.exit(1)
@@ -381,7 +389,7 @@ def start_perplexity_wrapper(install_dir: Path, log_manager: 'LogManager' = None
     server_file = wrapper_dir / "openai_server.py"
 
     if not server_file.exists():
-        print(f"{Colors.FAIL}Error: openai_server.py not found{Colors.ENDC}")
+        print(Colors.c("Error: openai_server.py not found", Colors.FAIL))
         print(f"Expected: {server_file}")
         print(f"Wrapper dir: {wrapper_dir}")
         sys.exit(1)
@@ -389,11 +397,11 @@ def start_perplexity_wrapper(install_dir: Path, log_manager: 'LogManager' = None
     # Check if .env exists in wrapper dir
     env_file = wrapper_dir / ".env"
     if not env_file.exists():
-        print(f"{Colors.WARNING}Warning: .env not found in {wrapper_dir}{Colors.ENDC}")
+        print(Colors.c(f"Warning: .env not found in {wrapper_dir}", Colors.WARNING))
         print("Server may fail without session token")
 
-    print(f"{Colors.OKCYAN}→ Running: {sys.executable} openai_server.py{Colors.ENDC}")
-    print(f"{Colors.OKCYAN}→ Working dir: {wrapper_dir}{Colors.ENDC}")
+    print(Colors.c(f"→ Running: {sys.executable} openai_server.py", Colors.OKCYAN))
+    print(Colors.c(f"→ Working dir: {wrapper_dir}", Colors.OKCYAN))
 
     # Build command - use current Python interpreter (which is the venv if activated)
     cmd = [sys.executable, "openai_server.py"]
@@ -405,9 +413,9 @@ def start_perplexity_wrapper(install_dir: Path, log_manager: 'LogManager' = None
 
     # Print separator
     print()
-    print(f"{Colors.OKGREEN}{'=' * 60}{Colors.ENDC}")
-    print(f"{Colors.OKGREEN}Perplexity Wrapper Output:{Colors.ENDC}")
-    print(f"{Colors.OKGREEN}{'=' * 60}{Colors.ENDC}")
+    print(Colors.c(f"{'=' * 60}", Colors.OKGREEN))
+    print(Colors.c("Perplexity Wrapper Output:", Colors.OKGREEN))
+    print(Colors.c(f"{'=' * 60}", Colors.OKGREEN))
 
     # Setup logging if log_manager provided
     stdout_file = None
@@ -448,19 +456,19 @@ def start_perplexity_wrapper(install_dir: Path, log_manager: 'LogManager' = None
             sys.exit(1)
 
         if check_service_health("http://localhost:8000/health"):
-            print(f"{Colors.OKGREEN}✓ Service is healthy{Colors.ENDC}")
+            print(Colors.c("✓ Service is healthy", Colors.OKGREEN))
             return process
 
         # Show progress every 5 seconds
         if (i + 1) % 5 == 0:
-            print(f"{Colors.OKCYAN}  Waiting {i + 1}s... (timeout in {max_wait - i}s){Colors.ENDC}")
+            print(Colors.c(f"  Waiting {i + 1}s... (timeout in {max_wait - i}s)", Colors.OKCYAN))
 
         time.sleep(1)
 
     # If health check fails, check if port is at least listening
     if is_port_in_use(8000):
-        print(f"{Colors.WARNING}⚠ Health check failed but port is listening{Colors.ENDC}")
-        print(f"{Colors.OKGREEN}✓ Assuming service is ready{Colors.ENDC}")
+        print(Colors.c("⚠ Health check failed but port is listening", Colors.WARNING))
+        print(Colors.c("✓ Assuming service is ready", Colors.OKGREEN))
         return process
 
     print_status("Perplexity Wrapper", "error", "Failed to start (timeout)")
@@ -473,11 +481,11 @@ def start_litellm_proxy(install_dir: Path, log_manager: 'LogManager' = None) ->
 
     config_file = install_dir / "litellm_config.yaml"
     if not config_file.exists():
-        print(f"{Colors.FAIL}Error: LiteLLM config not found{Colors.ENDC}")
+        print(Colors.c("Error: LiteLLM config not found", Colors.FAIL))
         print(f"Expected: {config_file}")
         sys.exit(1)
 
-    print(f"{Colors.OKCYAN}→ Running: litellm --config {config_file} --port 8080{Colors.ENDC}")
+    print(Colors.c(f"→ Running: litellm --config {config_file} --port 8080", Colors.OKCYAN))
 
     # Build command - use shell to inherit venv environment
     cmd = f'litellm --config "{config_file}" --port 8080'
@@ -496,9 +504,9 @@ def start_litellm_proxy(install_dir: Path, log_manager: 'LogManager' = None) ->
 
     # Print separator
     print()
-    print(f"{Colors.OKCYAN}{'=' * 60}{Colors.ENDC}")
-    print(f"{Colors.OKCYAN}LiteLLM Proxy Output:{Colors.ENDC}")
-    print(f"{Colors.OKCYAN}{'=' * 60}{Colors.ENDC}")
+    print(Colors.c(f"{'=' * 60}", Colors.OKCYAN))
+    print(Colors.c("LiteLLM Proxy Output:", Colors.OKCYAN))
+    print(Colors.c(f"{'=' * 60}", Colors.OKCYAN))
 
     # Start the process with shell to find litellm in venv PATH
     if os.name == 'nt':
@@ -530,19 +538,19 @@ def start_litellm_proxy(install_dir: Path, log_manager: 'LogManager' = None) ->
             sys.exit(1)
 
         if check_service_health("http://localhost:8080/health/readiness"):
-            print(f"{Colors.OKGREEN}✓ Service is healthy{Colors.ENDC}")
+            print(Colors.c("✓ Service is healthy", Colors.OKGREEN))
             return process
 
         # Show progress every 5 seconds
         if (i + 1) % 5 == 0:
-            print(f"{Colors.OKCYAN}  Waiting {i + 1}s... (timeout in {max_wait - i}s){Colors.ENDC}")
+            print(Colors.c(f"  Waiting {i + 1}s... (timeout in {max_wait - i}s)", Colors.OKCYAN))
 
         time.sleep(1)
 
     # If health check fails, check if port is at least listening
     if is_port_in_use(8080):
-        print(f"{Colors.WARNING}⚠ Health check failed but port is listening{Colors.ENDC}")
-        print(f"{Colors.OKGREEN}✓ Assuming service is ready{Colors.ENDC}")
+        print(Colors.c("⚠ Health check failed but port is listening", Colors.WARNING))
+        print(Colors.c("✓ Assuming service is ready", Colors.OKGREEN))
         return process
 
     print_status("LiteLLM Proxy", "error", "Failed to start (timeout)")
@@ -558,7 +566,7 @@ def check_and_start_services(install_dir: Path) -> Tuple[Optional[subprocess.Pop
     log_manager = LogManager(install_dir)
 
     print()
-    print(f"{Colors.BOLD}Service Status Check{Colors.ENDC}")
+    print(Colors.c("Service Status Check", Colors.BOLD))
     print()
 
     # Check Perplexity wrapper (port 8000)
@@ -566,7 +574,7 @@ def check_and_start_services(install_dir: Path) -> Tuple[Optional[subprocess.Pop
         if check_service_health("http://localhost:8000/health"):
             print_status("Perplexity Wrapper", "running", "Already running on port 8000")
         else:
-            print(f"{Colors.WARNING}Port 8000 in use but not responding{Colors.ENDC}")
+            print(Colors.c("Port 8000 in use but not responding", Colors.WARNING))
             pid = find_process_on_port(8000)
             if pid:
                 print(f"Process {pid} is using port 8000")
@@ -577,17 +585,17 @@ def check_and_start_services(install_dir: Path) -> Tuple[Optional[subprocess.Pop
 
     # Fetch available models and update litellm config
     print()
-    print(f"{Colors.BOLD}Discovering Models{Colors.ENDC}")
+    print(Colors.c("Discovering Models", Colors.BOLD))
     print()
-    print(f"{Colors.OKCYAN}→ Fetching available models from Perplexity...{Colors.ENDC}")
+    print(Colors.c("→ Fetching available models from Perplexity...", Colors.OKCYAN))
     time.sleep(1)  # Give server a moment to settle
 
     models = fetch_available_models()
     if models:
-        print(f"{Colors.OKGREEN}✓ Found {len(models)} model(s){Colors.ENDC}")
+        print(Colors.c(f"✓ Found {len(models)} model(s)", Colors.OKGREEN))
         update_litellm_config(install_dir, models)
     else:
-        print(f"{Colors.WARNING}⚠ No models found, using default config{Colors.ENDC}")
+        print(Colors.c("⚠ No models found, using default config", Colors.WARNING))
 
     # Check LiteLLM proxy (port 8080)
     print()
@@ -595,7 +603,7 @@ def check_and_start_services(install_dir: Path) -> Tuple[Optional[subprocess.Pop
         if check_service_health("http://localhost:8080/health/readiness"):
             print_status("LiteLLM Proxy", "running", "Already running on port 8080")
         else:
-            print(f"{Colors.WARNING}Port 8080 in use but not responding{Colors.ENDC}")
+            print(Colors.c("Port 8080 in use but not responding", Colors.WARNING))
             pid = find_process_on_port(8080)
             if pid:
                 print(f"Process {pid} is using port 8080")
@@ -621,12 +629,6 @@ def check_claude_installed() -> bool:
 
 def launch_claude(model: str = None, extra_args: list = None):
     """Launch Claude Code with Perplexity backend"""
-    print()
-    print(f"{Colors.OKGREEN}{Colors.BOLD}{'=' * 60}{Colors.ENDC}")
-    print(f"{Colors.OKGREEN}{Colors.BOLD}Launching Claude Code with Perplexity Backend{Colors.ENDC}")
-    print(f"{Colors.OKGREEN}{Colors.BOLD}{'=' * 60}{Colors.ENDC}")
-    print()
-
     # Set environment variables for Claude
     env = os.environ.copy()
     env["ANTHROPIC_BASE_URL"] = "http://localhost:8080"
@@ -638,14 +640,24 @@ def launch_claude(model: str = None, extra_args: list = None):
     elif "ANTHROPIC_MODEL" not in env:
         env["ANTHROPIC_MODEL"] = "claude-sonnet-4.5"
 
-    print(f"{Colors.OKCYAN}Environment:{Colors.ENDC}")
-    print(f"  ANTHROPIC_BASE_URL = {env['ANTHROPIC_BASE_URL']}")
-    print(f"  ANTHROPIC_MODEL = {env.get('ANTHROPIC_MODEL', 'default')}")
-    print()
+    # Banner and environment summary written in one call instead of ~10 prints
+    sys.stdout.write("\n".join([
+        "",
+        Colors.c(_RULE, Colors.OKGREEN + Colors.BOLD),
+        Colors.c("Launching Claude Code with Perplexity Backend", Colors.OKGREEN + Colors.BOLD),
+        Colors.c(_RULE, Colors.OKGREEN + Colors.BOLD),
+        "",
+        Colors.c("Environment:", Colors.OKCYAN),
+        f"  ANTHROPIC_BASE_URL = {env['ANTHROPIC_BASE_URL']}",
+        f"  ANTHROPIC_MODEL = {env.get('ANTHROPIC_MODEL', 'default')}",
+        "",
+        "",
+    ]))
+    sys.stdout.flush()
 
     # Check if Claude is installed
     if not check_claude_installed():
-        print(f"{Colors.WARNING}Warning: Claude Code CLI not found{Colors.ENDC}")
+        print(Colors.c("Warning: Claude Code CLI not found", Colors.WARNING))
         print("Make sure Claude Code is installed and 'claude' is in your PATH")
         print()
         print("You can still use the services with other tools:")
@@ -657,9 +669,9 @@ def launch_claude(model: str = None, extra_args: list = None):
 
     try:
         # Launch Claude Code
-        print(f"{Colors.OKCYAN}Starting Claude Code...{Colors.ENDC}")
+        print(Colors.c("Starting Claude Code...", Colors.OKCYAN))
         if extra_args:
-            print(f"{Colors.OKCYAN}With arguments: {' '.join(extra_args)}{Colors.ENDC}")
+            print(Colors.c(f"With arguments: {' '.join(extra_args)}", Colors.OKCYAN))
         print()
 
         # On Windows, use shell=True and properly quote arguments
@@ -678,12 +690,12 @@ def launch_claude(model: str = None, extra_args: list = None):
             subprocess.run(cmd, env=env)
     except KeyboardInterrupt:
         print()
-        print(f"{Colors.WARNING}Claude Code session ended{Colors.ENDC}")
+        print(Colors.c("Claude Code session ended", Colors.WARNING))
 
 def cleanup_processes(wrapper_process, litellm_process):
     """Clean up spawned processes"""
     print()
-    print(f"{Colors.OKCYAN}Cleaning up services...{Colors.ENDC}")
+    print(Colors.c("Cleaning up services...", Colors.OKCYAN))
 
     if wrapper_process:
         try:
@@ -710,30 +722,35 @@ def cleanup_processes(wrapper_process, litellm_process):
 def start_services_only(install_dir: Path) -> Tuple[subprocess.Popen, subprocess.Popen, LogManager]:
     """Start services and keep them running"""
     print()
-    print(f"{Colors.BOLD}Starting Perplexity Services{Colors.ENDC}")
+    print(Colors.c("Starting Perplexity Services", Colors.BOLD))
     print()
-    print(f"{Colors.OKCYAN}→ Install directory: {install_dir}{Colors.ENDC}")
+    print(Colors.c(f"→ Install directory: {install_dir}", Colors.OKCYAN))
 
     # Check wrapper directory
     wrapper_dir = install_dir / "perplexity-openai-api-updated"
     if not wrapper_dir.exists():
-        print(f"{Colors.FAIL}Error: Wrapper not found at {wrapper_dir}{Colors.ENDC}")
+        print(Colors.c(f"Error: Wrapper not found at {wrapper_dir}", Colors.FAIL))
         print("Run install_claude_perplexity.py first")
         sys.exit(1)
 
-    print(f"{Colors.OKCYAN}→ Wrapper directory: {wrapper_dir}{Colors.ENDC}")
+    print(Colors.c(f"→ Wrapper directory: {wrapper_dir}", Colors.OKCYAN))
 
     # Check and start services
     wrapper_process, litellm_process, log_manager = check_and_start_services(install_dir)
 
-    print()
-    print(f"{Colors.OKGREEN}Services are running!{Colors.ENDC}")
-    print(f"  Perplexity Wrapper: http://localhost:8000")
-    print(f"  LiteLLM Proxy: http://localhost:8080")
-    print()
-    print(f"{Colors.OKCYAN}Press Ctrl+C to stop services...{Colors.ENDC}")
-    print(f"{Colors.OKCYAN}Logs are saved in: {log_manager.logs_dir}{Colors.ENDC}")
-    print()
+    # Usage notice written in one call instead of eight prints
+    sys.stdout.write("\n".join([
+        "",
+        Colors.c("Services are running!", Colors.OKGREEN),
+        "  Perplexity Wrapper: http://localhost:8000",
+        "  LiteLLM Proxy: http://localhost:8080",
+        "",
+        Colors.c("Press Ctrl+C to stop services...", Colors.OKCYAN),
+        Colors.c(f"Logs are saved in: {log_manager.logs_dir}", Colors.OKCYAN),
+        "",
+        "",
+    ]))
+    sys.stdout.flush()
 
     # Open tail windows to show output
     services_to_tail = []
@@ -750,18 +767,18 @@ def start_services_only(install_dir: Path) -> Tuple[subprocess.Popen, subprocess
 def launch_claude_only(install_dir: Path, extra_args: list = None) -> None:
     """Launch Claude Code with existing services"""
     print()
-    print(f"{Colors.BOLD}Launching Claude Code with Perplexity Backend{Colors.ENDC}")
+    print(Colors.c("Launching Claude Code with Perplexity Backend", Colors.BOLD))
     print()
 
     # Check if services are running
     if not is_port_in_use(8000) or not is_port_in_use(8080):
-        print(f"{Colors.WARNING}Warning: Services may not be running{Colors.ENDC}")
+        print(Colors.c("Warning: Services may not be running", Colors.WARNING))
         if not is_port_in_use(8000):
             print(f"  Perplexity Wrapper (port 8000): Not running")
         if not is_port_in_use(8080):
             print(f"  LiteLLM Proxy (port 8080): Not running")
         print()
-        response = input(f"{Colors.WARNING}Continue anyway? (y/n): {Colors.ENDC}")
+        response = input(Colors.c("Continue anyway? (y/n): ", Colors.WARNING))
         if response.lower() != 'y':
             return
 
@@ -770,7 +787,7 @@ def launch_claude_only(install_dir: Path, extra_args: list = None) -> None:
     available_models = read_litellm_models(install_dir)
 
     if available_models:
-        print(f"{Colors.BOLD}Available Models:{Colors.ENDC}")
+        print(Colors.c("Available Models:", Colors.BOLD))
         for i, model in enumerate(available_models, 1):
             print(f"  {i}. {model}")
         print()
@@ -778,7 +795,7 @@ def launch_claude_only(install_dir: Path, extra_args: list = None) -> None:
         # Ask user to select a model
         while True:
             try:
-                choice = input(f"{Colors.OKCYAN}Select model (1-{len(available_models)}) or press Enter for first: {Colors.ENDC}").strip()
+                choice = input(Colors.c(f"Select model (1-{len(available_models)}) or press Enter for first: ", Colors.OKCYAN)).strip()
                 if not choice:
                     selected_model = available_models[0]
                     break
@@ -786,18 +803,18 @@ def launch_claude_only(install_dir: Path, extra_args: list = None) -> None:
                 if 0 <= idx < len(available_models):
                     selected_model = available_models[idx]
                     break
-                print(f"{Colors.FAIL}Invalid selection{Colors.ENDC}")
+                print(Colors.c("Invalid selection", Colors.FAIL))
             except ValueError:
-                print(f"{Colors.FAIL}Please enter a valid number{Colors.ENDC}")
+                print(Colors.c("Please enter a valid number", Colors.FAIL))
 
         print()
-        print(f"{Colors.OKGREEN}✓ Selected model: {selected_model}{Colors.ENDC}")
+        print(Colors.c(f"✓ Selected model: {selected_model}", Colors.OKGREEN))
         print()
 
         # Launch Claude with selected model
         launch_claude(selected_model, extra_args)
     else:
-        print(f"{Colors.WARNING}⚠ No models found in config{Colors.ENDC}")
+        print(Colors.c("⚠ No models found in config", Colors.WARNING))
         print()
         launch_claude(extra_args=extra_args)
 
@@ -872,28 +889,42 @@ Features:
             monitor = ServiceMonitor(wrapper_process, litellm_process, check_interval=30)
             monitor.start()
 
-            # Keep running until interrupted
+            # Flag-based shutdown: SIGTERM (service managers) and SIGINT
+            # (Ctrl+C) both set the event, so the finally-block cleanup
+            # always runs instead of relying on KeyboardInterrupt, which
+            # misses SIGTERM entirely. The handlers are scoped to this wait
+            # so Ctrl+C keeps its normal behavior everywhere else (startup
+            # health loops, interactive prompts, the default launch flow)
+            shutdown_event = threading.Event()
+
+            def _request_shutdown(signum, frame):
+                shutdown_event.set()
+
+            prev_sigterm = signal.signal(signal.SIGTERM, _request_shutdown)
+            prev_sigint = signal.signal(signal.SIGINT, _request_shutdown)
             try:
-                while True:
-                    time.sleep(1)
-            except KeyboardInterrupt:
-                print()
-                print(f"{Colors.WARNING}Stopping services...{Colors.ENDC}")
+                # Keep running until SIGTERM/SIGINT requests shutdown
+                shutdown_event.wait()
+            finally:
+                signal.signal(signal.SIGTERM, prev_sigterm)
+                signal.signal(signal.SIGINT, prev_sigint)
+            print()
+            print(Colors.c("Stopping services...", Colors.WARNING))
         else:
             # Default: Start services then launch Claude
             print()
-            print(f"{Colors.BOLD}Claude Code + Perplexity Launcher{Colors.ENDC}")
+            print(Colors.c("Claude Code + Perplexity Launcher", Colors.BOLD))
             print()
-            print(f"{Colors.OKCYAN}→ Install directory: {install_dir}{Colors.ENDC}")
+            print(Colors.c(f"→ Install directory: {install_dir}", Colors.OKCYAN))
 
             # Check wrapper directory
             wrapper_dir = install_dir / "perplexity-openai-api-updated"
             if not wrapper_dir.exists():
-                print(f"{Colors.FAIL}Error: Wrapper not found at {wrapper_dir}{Colors.ENDC}")
+                print(Colors.c(f"Error: Wrapper not found at {wrapper_dir}", Colors.FAIL))
                 print("Run install_claude_perplexity.py first")
                 sys.exit(1)
 
-            print(f"{Colors.OKCYAN}→ Wrapper directory: {wrapper_dir}{Colors.ENDC}")
+            print(Colors.c(f"→ Wrapper directory: {wrapper_dir}", Colors.OKCYAN))
 
             # Check and start services
             wrapper_process, litellm_process, log_manager = check_and_start_services(install_dir)
@@ -917,10 +948,10 @@ Features:
 
     except KeyboardInterrupt:
         print()
-        print(f"{Colors.WARNING}Interrupted by user{Colors.ENDC}")
+        print(Colors.c("Interrupted by user", Colors.WARNING))
     except Exception as e:
         print()
-        print(f"{Colors.FAIL}Error: {e}{Colors.ENDC}")
+        print(Colors.c(f"Error: {e}", Colors.FAIL))
         import traceback
         traceback.print_exc()
         sys.exit(1)
@@ -935,10 +966,10 @@ Features:
         # Close log files
         if log_manager:
             log_manager.close_all()
-            print(f"{Colors.OKCYAN}Logs saved to: {log_manager.logs_dir}{Colors.ENDC}")
+            print(Colors.c(f"Logs saved to: {log_manager.logs_dir}", Colors.OKCYAN))
 
         print()
-        print(f"{Colors.OKGREEN}Done{Colors.ENDC}")
+        print(Colors.c("Done", Colors.OKGREEN))
 
 if __name__ == "__main__":
     main()
@@ -3,34 +3,44 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import hashlib
+import hmac
 import json
 import logging
 import os
+import random
 import re
 import sys
 import threading
 import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
-from datetime import datetime
-from typing import Any, AsyncGenerator, Dict
+from datetime import datetime, timedelta
+from itertools import count
+from pathlib import Path
+from typing import Any, AsyncGenerator, Dict, Mapping
 
+from collections import OrderedDict, defaultdict
+
+import orjson
 import uvicorn
 from fastapi import FastAPI, HTTPException, Request, WebSocket
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, ConfigDict
-from slowapi import Limiter, _rate_limit_exceeded_handler
-from slowapi.util import get_remote_address
-from slowapi.errors import RateLimitExceeded
-from slowapi.middleware import SlowAPIMiddleware
 
 # Add src to path for local development
-# Use an absolute path to ensure it works when run from different directories
+# Use an absolute path to ensure it works when run from different directories.
+# Guarded so re-imports (uvicorn imports this module by string on top of
+# running it as __main__) don't stack duplicate entries and invalidate the
+# importlib path caches again.
 script_dir = os.path.dirname(os.path.abspath(__file__))
-sys.path.insert(0, os.path.join(script_dir, "src"))
+_src_dir = os.path.join(script_dir, "src")
+if _src_dir not in sys.path:
+    sys.path.insert(0, _src_dir)
 
 from perplexity_webui_scraper import (
     CitationMode,
@@ -74,12 +84,22 @@ class ServerConfig:
     @classmethod
     def from_env(cls) -> "ServerConfig":
         """Load configuration from environment variables."""
-        try:
-            from dotenv import load_dotenv
-            load_dotenv()
-        except ImportError:
-            pass
-        
+        # Only pay the dotenv import when there is actually a .env to load
+        if os.path.exists(".env"):
+            try:
+                from dotenv import load_dotenv
+                load_dotenv()
+            except ImportError:
+                pass
+
+        # getattr with a default beats the enum __getitem__ walk and turns an
+        # invalid value into a warning instead of an opaque KeyError
+        mode_name = os.getenv("DEFAULT_CITATION_MODE", "CLEAN").upper()
+        default_citation_mode = getattr(CitationMode, mode_name, None)
+        if default_citation_mode is None:
+            logging.warning("Invalid DEFAULT_CITATION_MODE '%s', using CLEAN", mode_name)
+            default_citation_mode = CitationMode.CLEAN
+
         session_token = os.getenv("PERPLEXITY_SESSION_TOKEN")
         if not session_token:
             session_token = os.environ.get("PERPLEXITY_SESSION_TOKEN")
@@ -104,7 +124,7 @@ class ServerConfig:
             conversation_timeout=int(os.getenv("CONVERSATION_TIMEOUT", "3600")),
             max_conversations_per_user=int(os.getenv("MAX_CONVERSATIONS_PER_USER", "100")),
             default_model=os.getenv("DEFAULT_MODEL", "perplexity-auto"),
-            default_citation_mode=CitationMode[os.getenv("DEFAULT_CITATION_MODE", "CLEAN").upper()],
+            default_citation_mode=default_citation_mode,
         )
 
 
@@ -112,6 +132,17 @@ class ServerConfig:
 # Dynamic Model Registry
 # =============================================================================
 
+# Alias-generation patterns, compiled once instead of per model
+_GPT_RE = re.compile(r'gpt(\d)(\d)')
+_CLAUDE_OPUS_RE = re.compile(r'opus(\d+)')
+_CLAUDE_SONNET_RE = re.compile(r'(\d+)sonnet')
+_GEMINI_RE = re.compile(r'gemini(\d+)pro')
+_GROK_RE = re.compile(r'grok(\d+)')
+
+# On-disk cache of the fetched model list (stale-while-revalidate)
+_MODELS_CACHE_PATH = Path("~/.cache/perplexity-openai/models.json").expanduser()
+
+
 class ModelRegistry:
     """Manages available models fetched from Perplexity."""
     
@@ -119,29 +150,87 @@ class ModelRegistry:
         self._models: list[FetchedModelInfo] = []
         self._mapping: dict[str, Model] = {}
         self._available: list[dict[str, str]] = []
+        self._by_id: dict[str, dict[str, str]] = {}
         self._last_fetch: datetime | None = None
         self._refresh_interval = 3600  # 1 hour
+        self._fetcher: PerplexityModelsFetcher | None = None
     
     def fetch(self, session_token: str) -> None:
-        """Fetch available models from Perplexity."""
+        """Fetch available models, serving the on-disk cache first (stale-while-revalidate).
+
+        A fresh cache (younger than the refresh interval) is served as-is. A stale
+        cache is served immediately while a background thread revalidates it, so
+        startup never blocks on a network round-trip unless no cache exists at all.
+        """
+        try:
+            cache_age = time.time() - _MODELS_CACHE_PATH.stat().st_mtime
+        except OSError:
+            cache_age = None
+
+        if cache_age is not None and self._load_cache():
+            self._last_fetch = datetime.now()
+            if cache_age <= self._refresh_interval:
+                logging.info(f"✅ Loaded {len(self._models)} models from cache")
+                return
+            logging.info(f"✅ Loaded {len(self._models)} models from stale cache, revalidating in background")
+            threading.Thread(target=self._fetch_remote, args=(session_token,), daemon=True).start()
+            return
+
+        self._fetch_remote(session_token)
+
+    def _load_cache(self) -> bool:
+        """Load the cached model list. Returns False if missing or corrupt."""
+        try:
+            data = json.loads(_MODELS_CACHE_PATH.read_text())
+            self._models = [FetchedModelInfo(**item) for item in data]
+        except Exception as e:
+            logging.debug(f"Could not load models cache: {e}")
+            return False
+
+        self._build_mappings()
+        return True
+
+    def _fetch_remote(self, session_token: str) -> None:
+        """Fetch models from Perplexity and rewrite the cache atomically."""
         logging.info("🔄 Fetching models from Perplexity...")
-        
+
         try:
-            with PerplexityModelsFetcher(session_token) as fetcher:
-                self._models = fetcher.fetch_models()
-            
+            # Reuse one fetcher across refreshes so its HTTP session (and TLS
+            # connection) survives instead of being torn down every hour
+            if self._fetcher is None:
+                self._fetcher = PerplexityModelsFetcher(session_token)
+            self._models = self._fetcher.fetch_models()
+
             self._build_mappings()
             self._last_fetch = datetime.now()
+            self._write_cache()
             logging.info(f"✅ Loaded {len(self._models)} models")
-            
+
         except Exception as e:
             logging.error(f"❌ Failed to fetch models: {e}")
-            self._use_defaults()
-    
+            # Don't clobber cached mappings when a background revalidation fails
+            if not self._mapping:
+                self._use_defaults()
+
+    def _write_cache(self) -> None:
+        """Persist the model list, via a temp file and os.replace so readers never see a partial write."""
+        try:
+            _MODELS_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = _MODELS_CACHE_PATH.with_suffix(".json.tmp")
+            tmp_path.write_text(json.dumps([m.to_dict() for m in self._models]))
+            os.replace(tmp_path, _MODELS_CACHE_PATH)
+        except OSError as e:
+            logging.debug(f"Could not write models cache: {e}")
+
     def _build_mappings(self) -> None:
-        """Build model mappings and available list."""
+        """Build model mappings and available list.
+
+        Everything is built into locals and swapped onto the instance at the
+        end, so event-loop readers never observe a half-populated mapping
+        while a background revalidation thread rebuilds it.
+        """
         # Static aliases
-        self._mapping = {
+        mapping = {
             "gpt-4": Models.BEST,
             "gpt-4-turbo": Models.BEST,
             "gpt-4o": Models.BEST,
@@ -156,74 +245,84 @@ class ModelRegistry:
             "labs": Models.LABS,
         }
         
-        self._available = [
+        available = [
             {"id": "perplexity-auto", "name": "Perplexity Auto", "owned_by": "perplexity"},
             {"id": "perplexity-sonar", "name": "Perplexity Sonar", "owned_by": "perplexity"},
             {"id": "perplexity-research", "name": "Perplexity Research", "owned_by": "perplexity"},
             {"id": "perplexity-labs", "name": "Perplexity Labs", "owned_by": "perplexity"},
         ]
-        
-        # Add fetched models
+
+        # Add fetched models (set-based dedup keeps this loop O(N))
+        seen_ids = {m["id"] for m in available}
         for model in self._models:
             model_obj = Model(identifier=model.identifier, mode=model.mode)
-            
+            ident_l = model.identifier.lower()
+
             # Add direct identifier
-            self._mapping[model.identifier.lower()] = model_obj
-            
-            # Add aliases
-            for alias in self._generate_aliases(model.identifier):
-                self._mapping[alias.lower()] = model_obj
-            
+            mapping[ident_l] = model_obj
+
+            # Add aliases (built from lowercase fragments, no re-lowering needed)
+            aliases = self._base_aliases(ident_l)
+            for alias in aliases:
+                mapping[alias] = model_obj
+
+            # Thinking variants get suffixed aliases pointing at the same object,
+            # without materializing a second list just to extend the first
+            if "thinking" in ident_l:
+                for alias in aliases:
+                    mapping[alias + "-thinking"] = model_obj
+
             # Add to available list
-            if not any(m["id"] == model.identifier for m in self._available):
-                self._available.append({
+            if model.identifier not in seen_ids:
+                seen_ids.add(model.identifier)
+                available.append({
                     "id": model.identifier,
                     "name": model.name,
                     "owned_by": model.provider.lower(),
                 })
-    
-    def _generate_aliases(self, identifier: str) -> list[str]:
-        """Generate friendly aliases for a model identifier."""
+
+        self._mapping = mapping
+        self._available = available
+        # id -> entry index for O(1) /v1/models/{id} lookups
+        self._by_id = {m["id"]: m for m in available}
+
+    def _base_aliases(self, id_lower: str) -> list[str]:
+        """Generate friendly base aliases (no thinking suffix) for a lowercased identifier."""
         aliases = []
-        id_lower = identifier.lower()
-        
+
         # GPT: gpt51 -> gpt-5.1, gpt-51
         if id_lower.startswith("gpt"):
-            match = re.match(r'gpt(\d)(\d)', id_lower)
+            match = _GPT_RE.match(id_lower)
             if match:
                 aliases.extend([f"gpt-{match.group(1)}.{match.group(2)}", f"gpt-{match.group(1)}{match.group(2)}"])
-        
+
         # Claude: claude45sonnet -> claude-4.5-sonnet
         elif id_lower.startswith("claude"):
             if "opus" in id_lower:
-                match = re.search(r'opus(\d+)', id_lower)
+                match = _CLAUDE_OPUS_RE.search(id_lower)
                 if match:
                     v = match.group(1)
                     aliases.extend([f"claude-opus-{v[0]}.{v[1:]}" if len(v) > 1 else f"claude-opus-{v}"])
             elif "sonnet" in id_lower:
-                match = re.search(r'(\d+)sonnet', id_lower)
+                match = _CLAUDE_SONNET_RE.search(id_lower)
                 if match:
                     v = match.group(1)
                     aliases.extend([f"claude-{v[0]}.{v[1:]}-sonnet" if len(v) > 1 else f"claude-{v}-sonnet"])
-        
+
         # Gemini: gemini30pro -> gemini-3-pro
         elif id_lower.startswith("gemini"):
-            match = re.search(r'gemini(\d+)pro', id_lower)
+            match = _GEMINI_RE.search(id_lower)
             if match:
                 v = match.group(1)
                 aliases.extend([f"gemini-{v[0]}-pro", f"gemini-{v}-pro"])
-        
+
         # Grok: grok41 -> grok-4.1
         elif id_lower.startswith("grok"):
-            match = re.search(r'grok(\d+)', id_lower)
+            match = _GROK_RE.search(id_lower)
             if match:
                 v = match.group(1)
                 aliases.extend([f"grok-{v[0]}.{v[1:]}" if len(v) > 1 else f"grok-{v}"])
-        
-        # Add thinking suffix variants
-        if "thinking" in id_lower:
-            aliases.extend([f"{a}-thinking" for a in aliases])
-        
+
         return aliases
     
     def _use_defaults(self) -> None:
@@ -240,19 +339,30 @@ class ModelRegistry:
             {"id": "perplexity-sonar", "name": "Perplexity Sonar", "owned_by": "perplexity"},
             {"id": "perplexity-research", "name": "Perplexity Research", "owned_by": "perplexity"},
         ]
-    
+        self._by_id = {m["id"]: m for m in self._available}
+
+    def close(self) -> None:
+        """Close the cached fetcher and its HTTP session."""
+        if self._fetcher is not None:
+            self._fetcher.close()
+            self._fetcher = None
+
     def get(self, name: str) -> Model:
         """Get a Model by name or alias."""
-        key = name.lower().strip()
-        if key in self._mapping:
-            return self._mapping[key]
-        logging.warning(f"Unknown model '{name}', using default")
-        return Models.BEST
+        model = self._mapping.get(name.lower().strip())
+        if model is None:
+            logging.warning("Unknown model '%s', using default", name)
+            return Models.BEST
+        return model
     
     def list_available(self) -> list[dict[str, str]]:
         """Get list of available models."""
         return self._available
-    
+
+    def get_info(self, model_id: str) -> dict[str, str] | None:
+        """Get the available-list entry for a model id, or None."""
+        return self._by_id.get(model_id)
+
     def needs_refresh(self) -> bool:
         """Check if models need refreshing."""
         if not self._last_fetch:
@@ -264,12 +374,17 @@ class ModelRegistry:
 # Conversation Manager
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class ConversationSession:
-    """Active conversation session."""
+    """Active conversation session.
+
+    last_used is time.monotonic() seconds: touches and timeout sweeps only
+    need relative age, and monotonic is much cheaper than datetime.now().
+    created_at stays a datetime for display.
+    """
     conversation: Conversation
     created_at: datetime
-    last_used: datetime
+    last_used: float
     user_id: str | None = None
     model: str = "perplexity-auto"
     message_count: int = 0
@@ -283,6 +398,9 @@ class ConversationManager:
         self._timeout = timeout
         self._max_per_user = max_per_user
         self._sessions: Dict[str, ConversationSession] = {}
+        # Secondary per-user index in LRU order, so enforcing
+        # max_conversations_per_user is O(1) instead of a full session scan
+        self._by_user: defaultdict[str, OrderedDict[str, ConversationSession]] = defaultdict(OrderedDict)
         self._cleanup_task: asyncio.Task | None = None
     
     def start_cleanup(self) -> None:
@@ -302,16 +420,36 @@ class ConversationManager:
         """Periodically clean up expired sessions."""
         while True:
             await asyncio.sleep(300)
-            now = datetime.now()
-            expired = [
-                cid for cid, sess in self._sessions.items()
-                if (now - sess.last_used).total_seconds() > self._timeout
-            ]
-            for cid in expired:
-                del self._sessions[cid]
-            if expired:
-                logging.info(f"Cleaned up {len(expired)} expired conversations")
+            now = time.monotonic()
+            # Rebuild the dict once instead of N incremental deletes
+            live = {
+                cid: sess for cid, sess in self._sessions.items()
+                if now - sess.last_used <= self._timeout
+            }
+            expired_count = len(self._sessions) - len(live)
+            if expired_count:
+                self._sessions = live
+                # Prune the per-user indexes in place, preserving LRU order
+                for uid in list(self._by_user):
+                    pruned = OrderedDict(
+                        (cid, sess) for cid, sess in self._by_user[uid].items() if cid in live
+                    )
+                    if pruned:
+                        self._by_user[uid] = pruned
+                    else:
+                        del self._by_user[uid]
+                logging.info(f"Cleaned up {expired_count} expired conversations")
     
+    def _discard(self, conversation_id: str) -> None:
+        """Remove a session from the primary map and the per-user index."""
+        session = self._sessions.pop(conversation_id, None)
+        if session and session.user_id:
+            user_index = self._by_user.get(session.user_id)
+            if user_index is not None:
+                user_index.pop(conversation_id, None)
+                if not user_index:
+                    del self._by_user[session.user_id]
+
     def get_or_create(
         self,
         conversation_id: str | None,
@@ -320,51 +458,62 @@ class ConversationManager:
         citation_mode: CitationMode,
     ) -> tuple[str, ConversationSession]:
         """Get existing or create new conversation session."""
+        # One clock read per call, shared by the hit and create paths
+        now = time.monotonic()
+
         # Return existing
         if conversation_id and conversation_id in self._sessions:
             session = self._sessions[conversation_id]
-            session.last_used = datetime.now()
+            session.last_used = now
             session.message_count += 1
+            if session.user_id:
+                self._by_user[session.user_id].move_to_end(conversation_id)
             return conversation_id, session
-        
-        # Enforce per-user limit
+
+        # Enforce per-user limit: evict the least recently used session
         if user_id:
-            user_sessions = [s for s in self._sessions.values() if s.user_id == user_id]
-            if len(user_sessions) >= self._max_per_user:
-                oldest = min(user_sessions, key=lambda s: s.last_used)
-                for cid, sess in list(self._sessions.items()):
-                    if sess is oldest:
-                        del self._sessions[cid]
-                        break
-        
+            user_index = self._by_user[user_id]
+            if len(user_index) >= self._max_per_user:
+                old_id, _ = user_index.popitem(last=False)
+                del self._sessions[old_id]
+
         # Create new
         config = ConversationConfig(citation_mode=citation_mode)
         conversation = self._client.create_conversation(config)
         new_id = conversation_id or str(uuid.uuid4())
-        
+
         session = ConversationSession(
             conversation=conversation,
-            created_at=datetime.now(),
-            last_used=datetime.now(),
+            created_at=datetime.now(),  # wall clock kept for display only
+            last_used=now,
             user_id=user_id,
             model=model,
         )
         self._sessions[new_id] = session
+        if user_id:
+            self._by_user[user_id][new_id] = session
         return new_id, session
     
     def list_sessions(self, user_id: str | None) -> list[dict]:
         """List sessions, optionally filtered by user."""
-        result = []
-        for cid, sess in self._sessions.items():
-            if not user_id or sess.user_id == user_id:
-                result.append({
-                    "id": cid,
-                    "created_at": sess.created_at.isoformat(),
-                    "last_used": sess.last_used.isoformat(),
-                    "message_count": sess.message_count,
-                    "model": sess.model,
-                })
-        return sorted(result, key=lambda x: x["last_used"], reverse=True)
+        # Sort on the raw monotonic float before building the display dicts,
+        # so comparisons are one attribute access instead of dict lookups
+        pairs = [(cid, s) for cid, s in self._sessions.items() if not user_id or s.user_id == user_id]
+        pairs.sort(key=lambda p: p[1].last_used, reverse=True)
+
+        # Convert monotonic ages back to wall-clock time for display
+        mono_now = time.monotonic()
+        wall_now = datetime.now()
+        return [
+            {
+                "id": cid,
+                "created_at": sess.created_at.isoformat(),
+                "last_used": (wall_now - timedelta(seconds=mono_now - sess.last_used)).isoformat(),
+                "message_count": sess.message_count,
+                "model": sess.model,
+            }
+            for cid, sess in pairs
+        ]
     
     def delete(self, conversation_id: str, user_id: str | None) -> bool:
         """Delete a conversation session."""
@@ -373,15 +522,22 @@ class ConversationManager:
         session = self._sessions[conversation_id]
         if user_id and session.user_id and session.user_id != user_id:
             return False
-        del self._sessions[conversation_id]
+        self._discard(conversation_id)
         return True
     
     def get_stats(self) -> dict:
         """Get conversation statistics."""
+        # Fold both aggregates into one pass over the sessions
+        users: set[str] = set()
+        messages = 0
+        for sess in self._sessions.values():
+            messages += sess.message_count
+            if sess.user_id:
+                users.add(sess.user_id)
         return {
             "total": len(self._sessions),
-            "users": len(set(s.user_id for s in self._sessions.values() if s.user_id)),
-            "messages": sum(s.message_count for s in self._sessions.values()),
+            "users": len(users),
+            "messages": messages,
         }
     
     def close(self) -> None:
@@ -413,15 +569,23 @@ class ChatMessage(BaseModel):
         """Extract text content, handling both string and array formats."""
         if isinstance(self.content, str):
             return self.content
-        
+
+        # Extraction runs several times per request (query build, token
+        # estimates), so memoize the joined result on the instance
+        cached = self.__dict__.get("_text_cache")
+        if cached is not None:
+            return cached
+
         # Handle array format - extract text from content parts
         text_parts = []
         for part in self.content:
             if isinstance(part, dict):
                 if part.get("type") == "text" and "text" in part:
                     text_parts.append(part["text"])
-        
-        return "\n".join(text_parts) if text_parts else ""
+
+        text = "\n".join(text_parts) if text_parts else ""
+        self.__dict__["_text_cache"] = text
+        return text
 
 
 class ChatRequest(BaseModel):
@@ -529,8 +693,12 @@ class ErrorResponse(BaseModel):
 config: ServerConfig
 models: ModelRegistry
 manager: ConversationManager
-start_time: datetime
-request_count: int = 0
+start_monotonic: float
+# Request ids come from itertools.count: next() is a single C call, so
+# concurrent coroutines never lose increments the way `n += 1` can
+_request_counter = count(1)
+request_count: int = 0  # latest snapshot, for /stats
+scraper_executor: ThreadPoolExecutor | None = None
 
 
 # =============================================================================
@@ -540,6 +708,18 @@ request_count: int = 0
 # Load config early for middleware
 config = ServerConfig.from_env()
 
+# Auth material precomputed once: key bytes for a constant-time compare and
+# the derived user id, so the per-request path never hashes the key. The id is
+# a fingerprint of a high-entropy token, not security material, so blake2b with
+# an 8-byte digest gives the 16 hex chars directly without slicing sha256.
+_EXPECTED_KEY_BYTES = config.api_key.encode() if config.api_key else b""
+_EXPECTED_USER_ID = hashlib.blake2b(_EXPECTED_KEY_BYTES, digest_size=8).hexdigest() if config.api_key else None
+
+# Rate limiting is effectively disabled when the per-minute budget is too high
+# to ever trip; skip the per-request SlowAPI middleware frame entirely then
+_RATE_LIMIT_DISABLE_THRESHOLD = 10_000
+_rate_limiting_active = config.enable_rate_limiting and config.requests_per_minute < _RATE_LIMIT_DISABLE_THRESHOLD
+
 # Setup logging
 logging.basicConfig(
     level=getattr(logging, config.log_level.upper(), logging.INFO),
@@ -552,10 +732,14 @@ logging.getLogger("httpx").setLevel(logging.WARNING)
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan handler."""
-    global models, manager, start_time
-    
-    start_time = datetime.now()
-    
+    global models, manager, start_monotonic, scraper_executor
+
+    start_monotonic = time.monotonic()
+
+    # Dedicated pool for blocking scraper calls, so they never starve the
+    # event loop's default executor shared with other offloads
+    scraper_executor = ThreadPoolExecutor(max_workers=32, thread_name_prefix="pplx")
+
     # Initialize model registry and fetch models
     models = ModelRegistry()
     models.fetch(config.session_token)
@@ -565,21 +749,27 @@ async def lifespan(app: FastAPI):
     manager = ConversationManager(client, config.conversation_timeout, config.max_conversations_per_user)
     manager.start_cleanup()
     
-    # Setup rate limiting
-    if config.enable_rate_limiting:
+    # Setup rate limiting (slowapi imported lazily so disabled setups skip it entirely)
+    if _rate_limiting_active:
+        from slowapi import Limiter, _rate_limit_exceeded_handler
+        from slowapi.errors import RateLimitExceeded
+        from slowapi.util import get_remote_address
+
         limiter = Limiter(key_func=get_remote_address, default_limits=[f"{config.requests_per_minute}/minute"])
         app.state.limiter = limiter
         app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
     
     logging.info(f"🚀 Server starting on http://{config.host}:{config.port}")
     logging.info(f"   Models loaded: {len(models._models)}")
-    logging.info(f"   Rate limiting: {'Enabled' if config.enable_rate_limiting else 'Disabled'}")
+    logging.info(f"   Rate limiting: {'Enabled' if _rate_limiting_active else 'Disabled'}")
     logging.info(f"   Auth required: {'Yes' if config.api_key else 'No'}")
     
     yield
     
     await manager.stop_cleanup()
     manager.close()
+    models.close()
+    scraper_executor.shutdown(wait=False)
 
 
 app = FastAPI(
@@ -596,7 +786,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-if config.enable_rate_limiting:
+if _rate_limiting_active:
+    from slowapi.middleware import SlowAPIMiddleware
+
     app.add_middleware(SlowAPIMiddleware)
 
 
@@ -604,81 +796,129 @@ if config.enable_rate_limiting:
 # Helpers
 # =============================================================================
 
+# Memoized header-value -> user-id resolutions, so repeat requests with the
+# same bearer token skip the constant-time compare entirely
+_AUTH_CACHE_MAX_SIZE = 1024
+_auth_cache: dict[str, str | None] = {}
+
+
+def _resolve_bearer(auth: str) -> str | None:
+    """Resolve an Authorization header value to a user ID, raising on invalid keys."""
+    cached = _auth_cache.get(auth)
+    if cached is not None:
+        return cached
+
+    if auth.startswith("Bearer ") and hmac.compare_digest(auth.encode()[7:], _EXPECTED_KEY_BYTES):
+        if len(_auth_cache) >= _AUTH_CACHE_MAX_SIZE:
+            del _auth_cache[next(iter(_auth_cache))]
+        _auth_cache[auth] = _EXPECTED_USER_ID
+        return _EXPECTED_USER_ID
+
+    raise HTTPException(status_code=401, detail="Invalid API key")
+
+
 def verify_auth(request: Request) -> str | None:
     """Verify API key and return user ID."""
     if not config.api_key:
         return None
-    
-    auth = request.headers.get("Authorization", "")
-    if auth.startswith("Bearer ") and auth[7:] == config.api_key:
-        return hashlib.sha256(auth[7:].encode()).hexdigest()[:16]
-    
-    raise HTTPException(status_code=401, detail="Invalid API key")
+
+    return _resolve_bearer(request.headers.get("Authorization", ""))
 
 
 def get_user(request: Request) -> str | None:
     """Get user identifier from request."""
-    try:
-        return verify_auth(request)
-    except HTTPException:
-        raise
-    except Exception:
-        return request.headers.get("X-User-ID")
+    # No API key configured: skip verify_auth and identify by the optional
+    # X-User-ID header directly (Starlette header lookup is case-insensitive)
+    if not config.api_key:
+        return request.headers.get("x-user-id")
+    return verify_auth(request)
 
 
-def get_user_from_headers(headers: dict[str, str] | None) -> str | None:
-    """Get user identifier from headers (e.g., WebSocket handshake headers)."""
+def get_user_from_headers(headers: Mapping[str, str] | None) -> str | None:
+    """Get user identifier from headers (e.g., WebSocket handshake headers).
+
+    Accepts any mapping with a case-insensitive or lowercase "authorization"
+    key; Starlette's Headers qualifies, so callers need not copy it to a dict.
+    """
     if not config.api_key:
-        return None
+        return headers.get("x-user-id") if headers else None
 
     if not headers:
         raise HTTPException(status_code=401, detail="Invalid API key")
 
-    auth = headers.get("authorization", "")
-    if auth.startswith("Bearer ") and auth[7:] == config.api_key:
-        return hashlib.sha256(auth[7:].encode()).hexdigest()[:16]
+    return _resolve_bearer(headers.get("authorization", ""))
 
-    raise HTTPException(status_code=401, detail="Invalid API key")
+
+# Role -> formatted-part prefix; tool and function results are included as context
+_ROLE_PREFIX = {
+    "system": "[System]\n",
+    "user": "User: ",
+    "assistant": "Assistant: ",
+    "tool": "[Tool Result]\n",
+    "function": "[Function Result]\n",
+}
 
 
 def messages_to_query(messages: list[ChatMessage]) -> str:
     """Convert messages to query string."""
-    user_msgs = [m for m in messages if m.role == "user"]
-    sys_msgs = [m for m in messages if m.role == "system"]
-    
-    if len(user_msgs) == 1 and not sys_msgs:
-        return user_msgs[0].get_text_content()
-    
+    # Single pass: count roles and build the formatted parts at the same time,
+    # instead of scanning messages three times with throwaway lists
+    user_count = 0
+    sys_count = 0
+    last_user_text = ""
     parts = []
     for msg in messages:
-        if msg.role == "system":
-            parts.append(f"[System]\n{msg.get_text_content()}")
-        elif msg.role == "user":
-            parts.append(f"User: {msg.get_text_content()}")
-        elif msg.role == "assistant":
-            parts.append(f"Assistant: {msg.get_text_content()}")
-        elif msg.role == "tool":
-            # Tool responses are included as context
-            parts.append(f"[Tool Result]\n{msg.get_text_content()}")
-        elif msg.role == "function":
-            # Function responses (deprecated but still supported)
-            parts.append(f"[Function Result]\n{msg.get_text_content()}")
+        prefix = _ROLE_PREFIX.get(msg.role)
+        if prefix is None:
+            continue
+        text = msg.get_text_content()
+        if msg.role == "user":
+            user_count += 1
+            last_user_text = text
+        elif msg.role == "system":
+            sys_count += 1
+        parts.append(prefix + text)
+
+    # Fast path: a single user message with no system prompt goes through verbatim
+    if user_count == 1 and sys_count == 0:
+        return last_user_text
     return "\n\n".join(parts)
 
 
+# Response ids are opaque non-security-sensitive identifiers, so a process-local
+# PRNG seeded once from the OS replaces a CSPRNG read + hex slice per request
+_id_rng = random.Random(os.urandom(16))
+
+
+def new_response_id(prefix: str) -> str:
+    """Generate a response ID: prefix plus 24 hex chars."""
+    return prefix + "%024x" % _id_rng.getrandbits(96)
+
+
 def estimate_tokens(text: str) -> int:
     """Estimate token count."""
     return len(text) // 4
 
 
-def parse_citation_mode(mode: str | None) -> CitationMode:
-    """Parse citation mode string."""
-    if not mode:
-        return config.default_citation_mode
+@functools.lru_cache(maxsize=32)
+def _parse_citation_mode_cached(mode: str) -> CitationMode | None:
+    """Resolve a raw mode string to a CitationMode, None if unknown.
+
+    Pure in its argument (the config default is applied by the caller), so the
+    uppercase allocation and enum lookup run once per distinct string.
+    """
     try:
         return CitationMode[mode.upper()]
     except KeyError:
+        return None
+
+
+def parse_citation_mode(mode: str | None) -> CitationMode:
+    """Parse citation mode string."""
+    if not mode:
         return config.default_citation_mode
+    parsed = _parse_citation_mode_cached(mode)
+    return parsed if parsed is not None else config.default_citation_mode
 
 
 # =============================================================================
@@ -690,7 +930,7 @@ async def health():
     """Health check endpoint."""
     return {
         "status": "healthy",
-        "uptime": (datetime.now() - start_time).total_seconds(),
+        "uptime": time.monotonic() - start_monotonic,
         "models": len(models._models),
     }
 
@@ -700,7 +940,7 @@ async def stats(request: Request):
     """Server statistics."""
     get_user(request)
     return {
-        "uptime": (datetime.now() - start_time).total_seconds(),
+        "uptime": time.monotonic() - start_monotonic,
         "requests": request_count,
         "conversations": manager.get_stats(),
         "models": {
@@ -729,10 +969,10 @@ async def get_model(model_id: str, request: Request):
     """Get model info."""
     get_user(request)
     
-    for m in models.list_available():
-        if m["id"] == model_id:
-            return ModelItem(id=m["id"], created=int(time.time()), owned_by=m["owned_by"])
-    
+    m = models.get_info(model_id)
+    if m is not None:
+        return ModelItem(id=m["id"], created=int(time.time()), owned_by=m["owned_by"])
+
     raise HTTPException(status_code=404, detail=f"Model '{model_id}' not found")
 
 
@@ -796,7 +1036,7 @@ class CompletionResponse(BaseModel):
 async def completions(request: Request, body: CompletionRequest):
     """Legacy completions endpoint for inline/code completions."""
     global request_count
-    request_count += 1
+    request_count = next(_request_counter)
     
     user_id = get_user(request)
     
@@ -837,27 +1077,31 @@ async def completions(request: Request, body: CompletionRequest):
         None, user_id, body.model, citation_mode
     )
     
-    response_id = f"cmpl-{uuid.uuid4().hex[:24]}"
+    response_id = new_response_id("cmpl-")
     created = int(time.time())
     
     try:
         # Run completion
-        await asyncio.to_thread(session.conversation.ask, prompt, model=model_obj, stream=False)
+        await asyncio.get_running_loop().run_in_executor(
+            scraper_executor, functools.partial(session.conversation.ask, prompt, model=model_obj, stream=False)
+        )
         answer = session.conversation.answer or ""
         
         # Add suffix if provided
         if body.suffix:
             answer = answer + body.suffix
         
+        prompt_tokens = estimate_tokens(prompt)
+        completion_tokens = estimate_tokens(answer)
         return CompletionResponse(
             id=response_id,
             created=created,
             model=body.model,
             choices=[CompletionChoice(index=0, text=answer)],
             usage=Usage(
-                prompt_tokens=estimate_tokens(prompt),
-                completion_tokens=estimate_tokens(answer),
-                total_tokens=estimate_tokens(prompt) + estimate_tokens(answer),
+                prompt_tokens=prompt_tokens,
+                completion_tokens=completion_tokens,
+                total_tokens=prompt_tokens + completion_tokens,
             ),
             system_fingerprint="perplexity_v1",
         )
@@ -873,7 +1117,8 @@ async def completions(request: Request, body: CompletionRequest):
 async def refresh_models(request: Request):
     """Force refresh models."""
     get_user(request)
-    models.fetch(config.session_token)
+    # Bypass the on-disk cache: a forced refresh must always hit Perplexity
+    models._fetch_remote(config.session_token)
     return {"status": "ok", "count": len(models._models)}
 
 
@@ -909,7 +1154,7 @@ async def chat_completions_info(request: Request):
 async def chat_completions(request: Request, body: ChatRequest):
     """Chat completions endpoint."""
     global request_count
-    request_count += 1
+    request_count = next(_request_counter)
     
     user_id = get_user(request)
     
@@ -948,7 +1193,7 @@ async def chat_completions(request: Request, body: ChatRequest):
     )
     
     query = messages_to_query(body.messages)
-    response_id = f"chatcmpl-{uuid.uuid4().hex[:24]}"
+    response_id = new_response_id("chatcmpl-")
     created = int(time.time())
     
     try:
@@ -960,18 +1205,22 @@ async def chat_completions(request: Request, body: ChatRequest):
             )
         else:
             # The scraper client is synchronous and may block. Run in a worker thread.
-            await asyncio.to_thread(session.conversation.ask, query, model=model_obj, stream=False)
+            await asyncio.get_running_loop().run_in_executor(
+                scraper_executor, functools.partial(session.conversation.ask, query, model=model_obj, stream=False)
+            )
             answer = session.conversation.answer or ""
             
+            prompt_tokens = estimate_tokens(query)
+            completion_tokens = estimate_tokens(answer)
             return ChatResponse(
                 id=response_id,
                 created=created,
                 model=body.model,
                 choices=[ChatChoice(index=0, message=ChatMessage(role="assistant", content=answer))],
                 usage=Usage(
-                    prompt_tokens=estimate_tokens(query),
-                    completion_tokens=estimate_tokens(answer),
-                    total_tokens=estimate_tokens(query) + estimate_tokens(answer),
+                    prompt_tokens=prompt_tokens,
+                    completion_tokens=completion_tokens,
+                    total_tokens=prompt_tokens + completion_tokens,
                 ),
                 system_fingerprint="perplexity_v1",
             )
@@ -993,7 +1242,19 @@ async def stream_response(
 ) -> AsyncGenerator[str, None]:
     """Stream chat response."""
     # Initial chunk
-    yield f"data: {ChatChunk(id=response_id, created=created, model=model_name, choices=[ChunkChoice(index=0, delta={'role': 'assistant', 'content': ''})], system_fingerprint='perplexity_v1').model_dump_json()}\n\n"
+    yield f"data: {ChatChunk.model_construct(id=response_id, created=created, model=model_name, choices=[ChunkChoice.model_construct(index=0, delta={'role': 'assistant', 'content': ''})], system_fingerprint='perplexity_v1').model_dump_json()}\n\n"
+
+    # Per-delta frames only vary in the content string, so they are assembled
+    # around a pre-built template instead of a pydantic model + JSON encode per
+    # token. The template mirrors ChatChunk.model_dump_json() field-for-field;
+    # the pydantic path remains for the initial and terminal frames.
+    delta_prefix = (
+        'data: {"id":' + orjson.dumps(response_id).decode()
+        + ',"object":"chat.completion.chunk","created":' + str(created)
+        + ',"model":' + orjson.dumps(model_name).decode()
+        + ',"choices":[{"index":0,"delta":{"content":'
+    )
+    delta_suffix = '},"finish_reason":null,"logprobs":null}],"system_fingerprint":"perplexity_v1","service_tier":null}\n\n'
 
     # The underlying streaming generator is synchronous and can block the event loop.
     # Move it to a background thread and ship deltas back through an asyncio queue.
@@ -1001,13 +1262,15 @@ async def stream_response(
     loop = asyncio.get_running_loop()
 
     def producer() -> None:
-        last = ""
+        # Track only how much of the growing answer has been shipped; slicing
+        # from an integer offset copies just the new tail, never the prefix
+        last_len = 0
         try:
             for resp in session.conversation.ask(query, model=model, stream=True):
                 current = resp.answer or ""
-                if len(current) > len(last):
-                    delta = current[len(last):]
-                    last = current
+                if len(current) > last_len:
+                    delta = current[last_len:]
+                    last_len = len(current)
                     loop.call_soon_threadsafe(queue.put_nowait, ("delta", delta))
             loop.call_soon_threadsafe(queue.put_nowait, ("done", ""))
         except Exception as e:
@@ -1016,30 +1279,54 @@ async def stream_response(
             try:
                 session.conversation.ask(query, model=model, stream=False)
                 current = session.conversation.answer or ""
-                if len(current) > len(last):
-                    loop.call_soon_threadsafe(queue.put_nowait, ("delta", current[len(last):]))
+                if len(current) > last_len:
+                    loop.call_soon_threadsafe(queue.put_nowait, ("delta", current[last_len:]))
                 loop.call_soon_threadsafe(queue.put_nowait, ("done", ""))
             except Exception as e2:
                 loop.call_soon_threadsafe(queue.put_nowait, ("error", str(e2) or str(e)))
 
-    threading.Thread(target=producer, daemon=True).start()
+    # Reuse pooled threads instead of spawning one per stream
+    scraper_executor.submit(producer)
 
     while True:
         kind, payload = await queue.get()
+
         if kind == "delta":
-            yield f"data: {ChatChunk(id=response_id, created=created, model=model_name, choices=[ChunkChoice(index=0, delta={'content': payload})], system_fingerprint='perplexity_v1').model_dump_json()}\n\n"
-        elif kind == "error":
+            # Coalesce deltas that queued up while we were writing, so a fast
+            # upstream costs one frame per drain instead of one per token.
+            # Stop at the first non-delta item and handle it after the flush.
+            pending: tuple[str, str] | None = None
+            while not queue.empty():
+                next_kind, next_payload = queue.get_nowait()
+                if next_kind != "delta":
+                    pending = (next_kind, next_payload)
+                    break
+                payload += next_payload
+            yield delta_prefix + orjson.dumps(payload).decode() + delta_suffix
+            if pending is None:
+                continue
+            kind, payload = pending
+
+        if kind == "error":
             logging.error(f"Streaming error: {payload}")
-            yield f"data: {ChatChunk(id=response_id, created=created, model=model_name, choices=[ChunkChoice(index=0, delta={}, finish_reason='error')], system_fingerprint='perplexity_v1').model_dump_json()}\n\n"
-            break
-        else:
-            break
+            yield f"data: {ChatChunk.model_construct(id=response_id, created=created, model=model_name, choices=[ChunkChoice.model_construct(index=0, delta={}, finish_reason='error')], system_fingerprint='perplexity_v1').model_dump_json()}\n\n"
+        break
     
     # Final chunk
-    yield f"data: {ChatChunk(id=response_id, created=created, model=model_name, choices=[ChunkChoice(index=0, delta={}, finish_reason='stop')], system_fingerprint='perplexity_v1').model_dump_json()}\n\n"
+    yield f"data: {ChatChunk.model_construct(id=response_id, created=created, model=model_name, choices=[ChunkChoice.model_construct(index=0, delta={}, finish_reason='stop')], system_fingerprint='perplexity_v1').model_dump_json()}\n\n"
     yield "data: [DONE]\n\n"
 
 
+# WebSocket control frames serialized once. The meta template takes a
+# JSON-encoded conversation id (it can be client-supplied, so it must be
+# escaped); the response id is server-generated hex and spliced verbatim.
+_PONG_FRAME = '{"type":"pong"}'
+_DONE_FRAME = '{"type":"done"}'
+_INVALID_JSON_FRAME = '{"error":"Invalid JSON"}'
+_MESSAGES_REQUIRED_FRAME = '{"error":"Messages required"}'
+_META_TEMPLATE = '{{"type":"meta","conversation_id":{},"response_id":"{}"}}'
+
+
 @app.websocket("/ws")
 async def ws_chat(ws: WebSocket):
     """WebSocket bridge for clients that expect a /ws endpoint.
@@ -1059,7 +1346,7 @@ async def ws_chat(ws: WebSocket):
 
     # Auth (if enabled)
     try:
-        user_id = get_user_from_headers(dict(ws.headers))
+        user_id = get_user_from_headers(ws.headers)
     except HTTPException:
         await ws.close(code=4401)
         return
@@ -1073,15 +1360,15 @@ async def ws_chat(ws: WebSocket):
             return
 
         try:
-            payload = json.loads(raw)
+            payload = orjson.loads(raw)
         except Exception:
-            await ws.send_text(json.dumps({"error": "Invalid JSON"}))
+            await ws.send_text(_INVALID_JSON_FRAME)
             await ws.close(code=1003)
             return
 
         # Lightweight ping/pong for clients that keep the socket alive
         if isinstance(payload, dict) and payload.get("type") == "ping":
-            await ws.send_text('{"type":"pong"}')
+            await ws.send_text(_PONG_FRAME)
             continue
 
         keep_open = bool(isinstance(payload, dict) and payload.get("keep_open", False))
@@ -1092,14 +1379,14 @@ async def ws_chat(ws: WebSocket):
         try:
             body = ChatRequest.model_validate(payload)
         except Exception as e:
-            await ws.send_text(json.dumps({"error": f"Invalid request: {e}"}))
+            await ws.send_text(orjson.dumps({"error": f"Invalid request: {e}"}).decode())
             await ws.close(code=1003)
             return
 
-        request_count += 1
+        request_count = next(_request_counter)
 
         if not body.messages:
-            await ws.send_text(json.dumps({"error": "Messages required"}))
+            await ws.send_text(_MESSAGES_REQUIRED_FRAME)
             await ws.close(code=1003)
             return
 
@@ -1110,44 +1397,89 @@ async def ws_chat(ws: WebSocket):
             body.conversation_id, user_id, body.model, citation_mode
         )
 
-        response_id = f"chatcmpl-{uuid.uuid4().hex[:24]}"
+        response_id = new_response_id("chatcmpl-")
         created = int(time.time())
 
         # Send conversation id so the client can reuse it
-        await ws.send_text(json.dumps({"type": "meta", "conversation_id": conv_id, "response_id": response_id}))
+        await ws.send_text(
+            _META_TEMPLATE.format(orjson.dumps(conv_id).decode(), response_id)
+        )
+
+        # One pass over the history serves both branches
+        query = messages_to_query(body.messages)
 
         try:
             if body.stream:
-                async for frame in stream_response(
+                frames = stream_response(
                     response_id,
                     created,
                     body.model,
                     model_obj,
-                    messages_to_query(body.messages),
+                    query,
                     session,
-                ):
-                    if ws_stream_format == "json" and frame.startswith("data: "):
-                        data = frame[len("data: "):].strip()
-                        if data == "[DONE]":
-                            await ws.send_text(json.dumps({"type": "done"}))
+                )
+                if ws_stream_format == "json":
+                    # One send per frame: every message must be a standalone
+                    # JSON document.
+                    async for frame in frames:
+                        if frame.startswith("data: "):
+                            data = frame[len("data: "):].strip()
+                            if data == "[DONE]":
+                                await ws.send_text(_DONE_FRAME)
+                            else:
+                                await ws.send_text(data)
                         else:
-                            await ws.send_text(data)
-                    else:
-                        await ws.send_text(frame)
+                            await ws.send_text(frame)
+                else:
+                    # Coalesce SSE frames into fewer WebSocket writes: flush
+                    # once the buffer reaches 4 KB or the next frame takes
+                    # more than 5 ms to arrive, so slow token streams are not
+                    # delayed. asyncio.wait leaves the pending __anext__ task
+                    # running across flushes (wait_for would cancel it inside
+                    # the generator).
+                    frame_iter = frames.__aiter__()
+                    next_frame = asyncio.ensure_future(frame_iter.__anext__())
+                    buf: list[str] = []
+                    buf_size = 0
+                    while True:
+                        done, _ = await asyncio.wait(
+                            {next_frame}, timeout=0.005 if buf else None
+                        )
+                        if not done:
+                            await ws.send_text("".join(buf))
+                            buf.clear()
+                            buf_size = 0
+                            continue
+                        try:
+                            frame = next_frame.result()
+                        except StopAsyncIteration:
+                            break
+                        next_frame = asyncio.ensure_future(frame_iter.__anext__())
+                        buf.append(frame)
+                        buf_size += len(frame)
+                        if buf_size >= 4096:
+                            await ws.send_text("".join(buf))
+                            buf.clear()
+                            buf_size = 0
+                    if buf:
+                        await ws.send_text("".join(buf))
             else:
-                query = messages_to_query(body.messages)
-                await asyncio.to_thread(session.conversation.ask, query, model=model_obj, stream=False)
+                await asyncio.get_running_loop().run_in_executor(
+                    scraper_executor, functools.partial(session.conversation.ask, query, model=model_obj, stream=False)
+                )
                 answer = session.conversation.answer or ""
 
+                prompt_tokens = estimate_tokens(query)
+                completion_tokens = estimate_tokens(answer)
                 resp = ChatResponse(
                     id=response_id,
                     created=created,
                     model=body.model,
                     choices=[ChatChoice(index=0, message=ChatMessage(role="assistant", content=answer))],
                     usage=Usage(
-                        prompt_tokens=estimate_tokens(query),
-                        completion_tokens=estimate_tokens(answer),
-                        total_tokens=estimate_tokens(query) + estimate_tokens(answer),
+                        prompt_tokens=prompt_tokens,
+                        completion_tokens=completion_tokens,
+                        total_tokens=prompt_tokens + completion_tokens,
                     ),
                     system_fingerprint="perplexity_v1",
                 )
@@ -1158,7 +1490,7 @@ async def ws_chat(ws: WebSocket):
                 return
         except Exception as e:
             logging.error(f"WebSocket request error: {e}")
-            await ws.send_text(json.dumps({"error": str(e)}))
+            await ws.send_text(orjson.dumps({"error": str(e)}).decode())
             await ws.close(code=1011)
             return
 
@@ -0,0 +1,80 @@
+"""
+CLI utility to decode binary log files written by configure_logging(binary=True).
+"""
+
+from __future__ import annotations
+
+from argparse import ArgumentParser
+from datetime import datetime
+from pathlib import Path
+from sys import exit, stderr, stdout
+
+from perplexity_webui_scraper.logging import _BINARY_RECORD_HEADER
+
+
+# loguru level numbers to names (see loguru defaults)
+_LEVEL_NAMES: dict[int, str] = {
+    5: "TRACE",
+    10: "DEBUG",
+    20: "INFO",
+    25: "SUCCESS",
+    30: "WARNING",
+    40: "ERROR",
+    50: "CRITICAL",
+}
+
+
+def decode_file(path: Path) -> int:
+    """Decode a binary log file and print text lines to stdout.
+
+    Args:
+        path: Path to the binary log file.
+
+    Returns:
+        Number of records decoded.
+    """
+
+    header_size = _BINARY_RECORD_HEADER.size
+    records = 0
+
+    with path.open("rb") as handle:
+        while True:
+            header = handle.read(header_size)
+
+            if len(header) < header_size:
+                break
+
+            timestamp_ns, level_no, location_length, message_length = _BINARY_RECORD_HEADER.unpack(header)
+            location = handle.read(location_length).decode("utf-8", errors="replace")
+            message = handle.read(message_length).decode("utf-8", errors="replace")
+
+            timestamp = datetime.fromtimestamp(timestamp_ns / 1_000_000_000)
+            level_name = _LEVEL_NAMES.get(level_no, str(level_no))
+
+            stdout.write(
+                f"{timestamp:%Y-%m-%d %H:%M:%S}.{timestamp.microsecond // 1000:03d}"
+                f" | {level_name: <8} | {location} | {message}\n"
+            )
+            records += 1
+
+    return records
+
+
+def main() -> None:
+    """
+    Decode a binary log file to text lines on stdout.
+    """
+
+    parser = ArgumentParser(description="Decode a perplexity-webui-scraper binary log file.")
+    parser.add_argument("log_file", type=Path, help="Path to the binary log file")
+    args = parser.parse_args()
+
+    if not args.log_file.is_file():
+        print(f"Error: file not found: {args.log_file}", file=stderr)  # noqa: T201
+        exit(1)
+
+    decode_file(args.log_file)
+
+
+if __name__ == "__main__":
+    main()
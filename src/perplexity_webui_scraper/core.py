@@ -439,7 +439,9 @@ class Conversation:
         cfg = self._config
 
         sources = (
-            [s.value for s in cfg.source_focus] if isinstance(cfg.source_focus, list) else [cfg.source_focus.value]
+            [s.value for s in cfg.source_focus]
+            if isinstance(cfg.source_focus, (list, tuple))
+            else [cfg.source_focus.value]
         )
 
         client_coordinates = None
@@ -39,7 +39,7 @@ from .resilience import (
 if TYPE_CHECKING:
     from collections.abc import Generator
 
-    from tenacity import RetryCallState
+    from .resilience import RetryState
 
 logger = get_logger(__name__)
 
@@ -178,14 +178,14 @@ class HTTPClient:
 
             logger.debug(f"Browser fingerprint rotated successfully | new_profile={new_profile}")
 
-    def _on_retry(self, retry_state: RetryCallState) -> None:
+    def _on_retry(self, retry_state: RetryState) -> None:
         """
         Callback executed before each retry attempt.
         """
 
         attempt = retry_state.attempt_number
-        exception = retry_state.outcome.exception() if retry_state.outcome else None
-        wait_time = retry_state.next_action.sleep if retry_state.next_action else 0
+        exception = retry_state.exception
+        wait_time = retry_state.wait_seconds
 
         logger.warning(
             f"Retry triggered | "
@@ -7,6 +7,7 @@ Logging is disabled by default and can be enabled via ClientConfig.
 from __future__ import annotations
 
 from pathlib import Path
+import struct
 import sys
 from typing import TYPE_CHECKING, Any
 
@@ -24,10 +25,43 @@ logger.remove()
 # Flag to track if logging is configured
 _logging_configured: bool = False
 
+# Binary record header: timestamp_ns (u64), level number (u8),
+# location byte length (u16), message byte length (u16).
+# Header is followed by the UTF-8 location ("name:function:line") and message.
+_BINARY_RECORD_HEADER = struct.Struct("<QBHH")
+
+# Field lengths are stored as u16, so payloads must fit in 65535 bytes
+_BINARY_FIELD_MAX = 0xFFFF
+
+
+def _create_binary_sink(log_file: str | PathLike[str]) -> Any:
+    """Create a loguru sink writing compact binary records.
+
+    Skips the text-format expansion entirely: each record is a fixed
+    header plus raw UTF-8 payloads, appended through a 64 KiB buffer.
+    Use the `pplx-log-decode` script to reconstruct text lines offline.
+    """
+
+    # The handle lives as long as the sink; loguru closes it via logger.remove()
+    handle = Path(log_file).open("ab", buffering=1 << 16)  # noqa: SIM115
+
+    def sink(message: Any) -> None:
+        record = message.record
+        location = f"{record['name']}:{record['function']}:{record['line']}".encode()[:_BINARY_FIELD_MAX]
+        text = record["message"].encode()[:_BINARY_FIELD_MAX]
+        timestamp_ns = int(record["time"].timestamp() * 1_000_000_000)
+
+        handle.write(_BINARY_RECORD_HEADER.pack(timestamp_ns, record["level"].no, len(location), len(text)))
+        handle.write(location)
+        handle.write(text)
+
+    return sink
+
 
 def configure_logging(
     level: LogLevel | str = LogLevel.DISABLED,
     log_file: str | PathLike[str] | None = None,
+    binary: bool = False,
 ) -> None:
     """Configure logging for the library.
 
@@ -35,11 +69,15 @@ def configure_logging(
         level: Logging level (LogLevel enum or string). Default is DISABLED.
         log_file: Optional file path to write logs. If set, logs go to file only.
                   If None, logs go to console. Logs are appended, never deleted.
+        binary: Write the log file as compact binary records instead of text.
+                Only applies when log_file is set. Decode with `pplx-log-decode`.
 
     Note:
         - If log_file is set: logs go to file only (no console output)
         - If log_file is None: logs go to console only
         - Log format includes timestamp, level, module, function, and message
+        - Binary mode defers text formatting out of the hot path, which matters
+          for long DEBUG-mode runs where every request and stream chunk is logged
     """
 
     global _logging_configured  # noqa: PLW0603
@@ -70,7 +108,15 @@ def configure_logging(
     # File format - detailed with extra context
     file_format = "{time:YYYY-MM-DD HH:mm:ss.SSS} | {level: <8} | {name}:{function}:{line} | {message} | {extra}"
 
-    if log_file is not None:
+    if log_file is not None and binary:
+        # Log to file only, as compact binary records (no console output)
+        logger.add(
+            _create_binary_sink(log_file),
+            level=level_str,
+            filter="perplexity_webui_scraper",
+            enqueue=True,  # Thread-safe
+        )
+    elif log_file is not None:
         # Log to file only (no console output)
         log_path = Path(log_file)
         logger.add(
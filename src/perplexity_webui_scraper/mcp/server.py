@@ -4,6 +4,7 @@ MCP server implementation using FastMCP.
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from os import environ
 from typing import Literal
 
@@ -66,13 +67,13 @@ ModelName = Literal[
     "kimi_thinking",
 ]
 
-# Source focus mapping
+# Source focus mapping (tuples so the values are shared, never re-created per call)
 SOURCE_FOCUS_MAP = {
-    "web": [SourceFocus.WEB],
-    "academic": [SourceFocus.ACADEMIC],
-    "social": [SourceFocus.SOCIAL],
-    "finance": [SourceFocus.FINANCE],
-    "all": [SourceFocus.WEB, SourceFocus.ACADEMIC, SourceFocus.SOCIAL],
+    "web": (SourceFocus.WEB,),
+    "academic": (SourceFocus.ACADEMIC,),
+    "social": (SourceFocus.SOCIAL,),
+    "finance": (SourceFocus.FINANCE,),
+    "all": (SourceFocus.WEB, SourceFocus.ACADEMIC, SourceFocus.SOCIAL),
 }
 
 SourceFocusName = Literal["web", "academic", "social", "finance", "all"]
@@ -80,6 +81,12 @@ SourceFocusName = Literal["web", "academic", "social", "finance", "all"]
 # Client singleton
 _client: Perplexity | None = None
 
+# LRU cache of final answers keyed on (query, model, source_focus).
+# Agent retry loops frequently re-ask the same question; a hit skips the
+# full HTTP-stream conversation.
+_ANSWER_CACHE_MAX_SIZE = 128
+_answer_cache: OrderedDict[tuple[str, str, str], str] = OrderedDict()
+
 
 def _get_client() -> Perplexity:
     """
@@ -122,34 +129,41 @@ def perplexity_ask(
         AI-generated answer with inline citations and a Citations section.
     """
 
-    client = _get_client()
-    selected_model = MODEL_MAP.get(model, Models.BEST)
-    sources = SOURCE_FOCUS_MAP.get(source_focus, [SourceFocus.WEB])
+    cache_key = (query, model, source_focus)
+    cached_answer = _answer_cache.get(cache_key)
+
+    if cached_answer is not None:
+        _answer_cache.move_to_end(cache_key)
+        return cached_answer
 
     try:
-        conversation = client.create_conversation(
+        # A fresh conversation per call keeps queries independent: reusing one
+        # would thread follow-up context between unrelated questions.
+        conversation = _get_client().create_conversation(
             ConversationConfig(
-                model=selected_model,
+                model=MODEL_MAP[model],
                 citation_mode=CitationMode.DEFAULT,
                 search_focus=SearchFocus.WEB,
-                source_focus=sources,
+                source_focus=SOURCE_FOCUS_MAP[source_focus],
             )
         )
-
         conversation.ask(query)
         answer = conversation.answer or "No answer received"
 
-        # Build response with Perplexity-style citations
-        response_parts = [answer]
+        # Build response with Perplexity-style citations; the single
+        # comprehension + join preallocates once instead of growing a string
+        citation_lines = [f"\n[{i}]: {result.url or ''}" for i, result in enumerate(conversation.search_results, 1)]
+        final_answer = answer + ("\n\nCitations:" + "".join(citation_lines) if citation_lines else "")
 
-        if conversation.search_results:
-            response_parts.append("\n\nCitations:")
+        # Only cache real answers; caching the empty-answer placeholder would
+        # pin a transient failure and defeat the retry loops the cache serves
+        if conversation.answer:
+            _answer_cache[cache_key] = final_answer
 
-            for i, result in enumerate(conversation.search_results, 1):
-                url = result.url or ""
-                response_parts.append(f"\n[{i}]: {url}")
+            if len(_answer_cache) > _ANSWER_CACHE_MAX_SIZE:
+                _answer_cache.popitem(last=False)
 
-        return "".join(response_parts)
+        return final_answer
     except Exception as error:
         return f"Error: {error!s}"
 
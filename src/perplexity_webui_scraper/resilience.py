@@ -2,20 +2,20 @@
 Resilience utilities for HTTP requests.
 
 Provides retry mechanisms, rate limiting, and Cloudflare bypass utilities
-using the tenacity library for robust retry handling.
+for robust retry handling.
 """
 
 from __future__ import annotations
 
 from collections.abc import Callable
 from dataclasses import dataclass, field
+from functools import wraps
+from itertools import count
 import random
 from threading import Lock
 import time
 from typing import TYPE_CHECKING, Any, TypeVar
 
-from tenacity import RetryCallState, retry, retry_if_exception_type, stop_after_attempt, wait_exponential_jitter
-
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -53,6 +53,9 @@ CLOUDFLARE_MARKERS: tuple[str, ...] = (
     "challenge-platform",
 )
 
+# Lowercased once at import; is_cloudflare_challenge runs on every HTTP response
+_CLOUDFLARE_MARKERS_LOWER: tuple[str, ...] = tuple(marker.lower() for marker in CLOUDFLARE_MARKERS)
+
 
 @dataclass(slots=True)
 class RetryConfig:
@@ -71,6 +74,21 @@ class RetryConfig:
     jitter: float = 0.5
 
 
+@dataclass(frozen=True, slots=True)
+class RetryState:
+    """Snapshot of a failed attempt, passed to retry callbacks.
+
+    Attributes:
+        attempt_number: The attempt that just failed (1-based).
+        exception: The exception raised by the failed attempt.
+        wait_seconds: Delay before the next attempt starts.
+    """
+
+    attempt_number: int
+    exception: BaseException
+    wait_seconds: float
+
+
 @dataclass
 class RateLimiter:
     """Token bucket rate limiter for throttling requests.
@@ -102,14 +120,21 @@ class RateLimiter:
             self._last_request = time.monotonic()
 
 
+# Round-robin position for fingerprint rotation (atomic C-level increment)
+_profile_rotation = count()
+
+
 def get_random_browser_profile() -> str:
-    """Get a random browser profile for fingerprint rotation.
+    """Get the next browser profile for fingerprint rotation.
+
+    Rotation is a deterministic round-robin through BROWSER_PROFILES, which
+    distributes profiles more evenly than uniform sampling over small runs.
 
     Returns:
         A browser profile identifier compatible with curl_cffi.
     """
 
-    return random.choice(BROWSER_PROFILES)
+    return BROWSER_PROFILES[next(_profile_rotation) % len(BROWSER_PROFILES)]
 
 
 def is_cloudflare_challenge(response_text: str, headers: dict[str, Any] | None = None) -> bool:
@@ -125,18 +150,15 @@ def is_cloudflare_challenge(response_text: str, headers: dict[str, Any] | None =
 
     text_lower = response_text.lower()
 
-    for marker in CLOUDFLARE_MARKERS:
-        if marker.lower() in text_lower:
+    for marker in _CLOUDFLARE_MARKERS_LOWER:
+        if marker in text_lower:
             return True
 
-    if headers:
-        for key in headers:
-            key_lower = key.lower()
-
-            if "cf-" in key_lower or "cloudflare" in key_lower:
-                return True
-
-    return False
+    # Real Cloudflare headers share the "cf-" prefix, so a prefix check
+    # short-circuits without scanning the whole key
+    return bool(headers) and any(
+        (key_lower := key.lower()).startswith("cf-") or "cloudflare" in key_lower for key in headers
+    )
 
 
 def is_cloudflare_status(status_code: int) -> bool:
@@ -152,12 +174,55 @@ def is_cloudflare_status(status_code: int) -> bool:
     return status_code in (403, 503, 520, 521, 522, 523, 524, 525, 526)
 
 
+def fast_retry(
+    func: Callable[[], T],
+    config: RetryConfig,
+    retryable_exceptions: tuple[type[Exception], ...],
+    on_retry: Callable[[RetryState], None] | None = None,
+) -> T:
+    """Call a function with exponential-backoff retries.
+
+    A plain while-loop retry: the success path pays no state-machine or
+    callback-setup cost, only the except clause allocates anything.
+
+    Args:
+        func: Zero-argument callable to execute.
+        config: Retry configuration.
+        retryable_exceptions: Tuple of exception types to retry on.
+        on_retry: Optional callback executed before each retry sleep.
+
+    Returns:
+        The function's return value.
+
+    Raises:
+        The last exception if all attempts fail, or immediately for
+        non-retryable exceptions.
+    """
+
+    for attempt in range(config.max_retries + 1):
+        try:
+            return func()
+        except retryable_exceptions as error:  # noqa: PERF203 — inherent to a retry loop
+            if attempt == config.max_retries:
+                raise
+
+            wait_seconds = min(config.max_delay, config.base_delay * 2**attempt)
+            wait_seconds += random.uniform(0, wait_seconds * config.jitter)
+
+            if on_retry is not None:
+                on_retry(RetryState(attempt_number=attempt + 1, exception=error, wait_seconds=wait_seconds))
+
+            time.sleep(wait_seconds)
+
+    raise AssertionError("unreachable")  # pragma: no cover
+
+
 def create_retry_decorator(
     config: RetryConfig,
     retryable_exceptions: tuple[type[Exception], ...],
-    on_retry: Callable[[RetryCallState], None] | None = None,
+    on_retry: Callable[[RetryState], None] | None = None,
 ) -> Callable[[Callable[..., T]], Callable[..., T]]:
-    """Create a tenacity retry decorator with the given configuration.
+    """Create a retry decorator with the given configuration.
 
     Args:
         config: Retry configuration.
@@ -168,14 +233,11 @@ def create_retry_decorator(
         A retry decorator configured with the given settings.
     """
 
-    return retry(
-        stop=stop_after_attempt(config.max_retries + 1),
-        wait=wait_exponential_jitter(
-            initial=config.base_delay,
-            max=config.max_delay,
-            jitter=config.max_delay * config.jitter,
-        ),
-        retry=retry_if_exception_type(retryable_exceptions),
-        before_sleep=on_retry,
-        reraise=True,
-    )
+    def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> T:
+            return fast_retry(lambda: func(*args, **kwargs), config, retryable_exceptions, on_retry)
+
+        return wrapper
+
+    return decorator